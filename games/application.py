@@ -3,6 +3,7 @@ from abc import ABC, abstractmethod
 
 import pygame
 from pygame.event import Event
+from pygame.locals import KEYDOWN, KEYUP, QUIT, K_q
 from pygame.surface import Surface
 from pygame.time import Clock
 
@@ -14,9 +15,9 @@ def handle_quit(event: Event) -> None:
 
     :param event: PyGame Event object.
     """
-    if event.type == pygame.QUIT:
+    if event.type == QUIT:
         raise QuitApplication
-    elif event.type == pygame.KEYUP and event.key == pygame.K_q:
+    elif event.type == KEYUP and event.key == K_q:
         raise QuitApplication
 
 
@@ -32,12 +33,22 @@ class GameApplication(ABC):
 
     #: Max number of rendered frames that can be skipped. This is mostly
     #  relevant on slower machines, in case the time it takes to update the
-    #  game state is greater than `TICK_STEP`.
+    #  game state is greater than `TICK_STEP`. Time elapsed beyond this many
+    #  ticks (e.g. a long stall) is dropped instead of caught up on.
     MAX_FRAMESKIP = 10
 
     #: Difference in time between ticks (ms)
     TICK_STEP = None
 
+    #: Event types handled by the application. Any other event is blocked
+    #  from reaching the event queue.
+    EVENT_TYPES = (QUIT, KEYDOWN, KEYUP)
+
+    #: If `True`, frames are only drawn and flipped to the display when the
+    #  application is marked as dirty (see `_dirty`). Useful for games
+    #  without interpolated movement, where most frames would be identical.
+    DRAW_ON_DIRTY = False
+
     def __init__(self):
         assert self.CAPTION, "Missing Application Caption."
         assert self.TICK_STEP, "Missing Tick Step."
@@ -45,12 +56,18 @@ class GameApplication(ABC):
         # Init PyGame
         pygame.init()
         pygame.display.set_caption(self.CAPTION)
+        pygame.event.set_blocked(None)
+        pygame.event.set_allowed(self.EVENT_TYPES)
 
         # Application Variables
-        self._next_tick = time_ms()
+        self._last_time = time_ms()
+        self._accumulator = 0.0  #: Elapsed time (ms) not yet simulated.
         self._render_clock = Clock()
         self._running = True
 
+        #: Set when the game state changed and the screen needs a redraw.
+        self._dirty = True
+
     # Interface
 
     @property
@@ -90,8 +107,7 @@ class GameApplication(ABC):
 
     def _calc_interpolation(self) -> float:
         """Calculate the Interpolation between game ticks."""
-        next_prediction = time_ms() + self.TICK_STEP - self._next_tick
-        interp = next_prediction / self.TICK_STEP
+        interp = self._accumulator / self.TICK_STEP
         return max(min(interp, 1.0), 0.0)  # Clip between 0 and 1
 
     def _update_game_state(self, tick: float) -> None:
@@ -104,19 +120,28 @@ class GameApplication(ABC):
 
     def _render_graphics(self):
         """Render the frame and display it in the screen."""
-        interpolation = self._calc_interpolation()
-        self._draw_graphics(interp=interpolation)
-        pygame.display.flip()
+        if self._dirty or not self.DRAW_ON_DIRTY:
+            interpolation = self._calc_interpolation()
+            self._draw_graphics(interp=interpolation)
+            pygame.display.flip()
+            self._dirty = False
+
         self._render_clock.tick()
 
     def _main_loop(self):
-        """Main Loop, repeated indefinitely, until it's stopped."""
-        loops = 0
+        """Main Loop, repeated indefinitely, until it's stopped.
+
+        The game state is updated in fixed `TICK_STEP` increments, consuming
+        the time accumulated since the last iteration.
+        """
         current_tick = time_ms()
-        while current_tick > self._next_tick and loops < self.MAX_FRAMESKIP:
+        elapsed = current_tick - self._last_time
+        self._last_time = current_tick
+        self._accumulator += min(elapsed, self.MAX_FRAMESKIP * self.TICK_STEP)
+
+        while self._accumulator >= self.TICK_STEP:
             self._update_game_state(tick=current_tick)
-            self._next_tick += self.TICK_STEP
-            loops += 1
+            self._accumulator -= self.TICK_STEP
 
         self._render_graphics()
 
@@ -1,6 +1,6 @@
 """Define the Main Application class."""
 from functools import cached_property
-from typing import Iterable
+from typing import Iterable, List, Optional, Tuple
 
 import pygame
 from pygame.event import Event
@@ -11,6 +11,7 @@ from games.application import GameApplication
 from games.projectile.projectile import ProjectileManager
 from games.projectile.settings import (
     BG_COLOR,
+    DEBUG_REFRESH,
     FPS_COLOR,
     FPS_SIZE,
     GRID_ALPHA,
@@ -23,7 +24,7 @@ from games.projectile.settings import (
 from games.projectile.terrain import Blueprint, Terrain
 from games.projectile.turret import Turret
 from games.snake.settings import DEBUG_COLOR
-from games.utils import Layer, multi_text
+from games.utils import Layer, multi_text, time_ms
 
 
 class MainApp(GameApplication):
@@ -56,9 +57,36 @@ class MainApp(GameApplication):
         self._proj_mgmt = ProjectileManager(blueprint=self._blueprint)
         self._hero = Turret(blueprint=self._blueprint, pm=self._proj_mgmt)
 
+        #: Layers to be blitted on each frame. Reused between frames.
+        self._layers: List[Tuple[Surface, Tuple[float, float]]] = []
+
+        #: Rendered debug text, refreshed every `DEBUG_REFRESH` ms.
+        self._debug_layers: List[Layer] = []
+        self._fps_text: Optional[Surface] = None
+        self._next_debug_refresh = 0.0
+
+    def _refresh_debug(self) -> bool:
+        """Check if the debug text is due to be rendered again."""
+        now = time_ms()
+        if now < self._next_debug_refresh:
+            return False
+
+        self._next_debug_refresh = now + DEBUG_REFRESH
+        return True
+
     @property
     def _debug_surface(self) -> Iterable[Layer]:
-        """Debug Message Layers."""
+        """Debug Message Layers.
+
+        Rendered again at most every `DEBUG_REFRESH` ms.
+        """
+        if self._refresh_debug():
+            self._debug_layers = list(self._render_debug())
+
+        return self._debug_layers
+
+    def _render_debug(self) -> Iterable[Layer]:
+        """Render the Debug Messages."""
         msgs = [
             f"FPS: {self._render_clock.get_fps()}",
             f"Block Size (m): {self._blueprint.block_size * PIXEL_SIZE}",
@@ -74,9 +102,15 @@ class MainApp(GameApplication):
 
     @property
     def _fps_surface(self) -> Surface:
-        """FPS Meter Surface."""
-        msg = f"FPS: {self._render_clock.get_fps()}"
-        return self._fps_font.render(msg, True, FPS_COLOR)
+        """FPS Meter Surface.
+
+        Rendered again at most every `DEBUG_REFRESH` ms.
+        """
+        if self._refresh_debug() or self._fps_text is None:
+            msg = f"FPS: {self._render_clock.get_fps()}"
+            self._fps_text = self._fps_font.render(msg, True, FPS_COLOR)
+
+        return self._fps_text
 
     @cached_property
     def _grid_surface(self) -> Surface:
@@ -111,11 +145,11 @@ class MainApp(GameApplication):
 
     def _draw_graphics(self, interp: float) -> None:
         """Draw contents of the frame to the Screen."""
-        layers = [
-            (self._terrain.surface, (0, 0)),
-            (self._proj_mgmt.build_surface(interp), (0, 0)),
-            (self._hero.surface, self._hero.render_pos),
-        ]
+        layers = self._layers
+        layers.clear()
+        layers.append((self._terrain.surface, (0, 0)))
+        layers.append((self._proj_mgmt.build_surface(interp), (0, 0)))
+        layers.append((self._hero.surface, self._hero.render_pos))
         if self._grid:
             layers.append((self._grid_surface, (0, 0)))
 
@@ -126,4 +160,4 @@ class MainApp(GameApplication):
             layers.append((self._fps_surface, (0, 0)))
 
         self._screen.fill(color=BG_COLOR)
-        self._screen.blits(layers)
+        self._screen.blits(layers, doreturn=0)
@@ -1,5 +1,6 @@
 """Define Projectiles and its manager."""
-from typing import Optional, Set
+from functools import cached_property
+from typing import List, Optional, Tuple
 
 import pygame
 from pygame import draw
@@ -23,6 +24,9 @@ class Projectile:
     #: Projectile Color.
     COLOR = Color(0xFF, 0x00, 0x00)
 
+    #: Projectile Radius.
+    RADIUS = 3
+
     #: Earth's gravity (m/s²), adjusted to logic update rate.
     GRAVITY = Vector2(0, 9.78 * SPEED_CONSTANT)
 
@@ -30,6 +34,14 @@ class Projectile:
     # TODO: Calculate for air.
     DRAG_CONSTANT = -0.4 * SPEED_CONSTANT
 
+    #: Velocity scaling applied every tick. Scaling by `1 + DRAG_CONSTANT` is
+    #  the same as adding the drag (`DRAG_CONSTANT * velocity`), but can be
+    #  done in place.
+    DRAG_FACTOR = 1 + DRAG_CONSTANT
+
+    #: Projectiles slower than this explode.
+    MIN_SPEED = 0.05
+
     #: Time (ms) for the
     EXPLOSION_TIME = 15000
 
@@ -44,25 +56,34 @@ class Projectile:
         :param pos: Initial Position, in screen coordinates.
         """
         self._blueprint: Blueprint = blueprint
-        self._curr_pos: Vector2 = pos
+
+        #: Current Position. Kept as plain floats, since it's updated on every
+        #  tick and doesn't need any of the Vector2 operations.
+        self._x: float = pos.x
+        self._y: float = pos.y
 
         self._explosion_time = time_ms() + self.EXPLOSION_TIME
 
         self.velocity = Vector2(velocity)
 
-    def _detect_floor_collision(self, future_pos: Vector2) -> None:
+        #: Collision rectangle, moved around by `get_rect`.
+        self._rect = Rect((0, 0), (self.RADIUS * 2, self.RADIUS * 2))
+
+    def _detect_floor_collision(self, future_y: float) -> None:
         """Detect if there was a collision with the floor."""
-        if future_pos.y >= self._blueprint.rect.height:
+        if future_y >= self._blueprint.rect.height:
             self._handle_reflection(normal=Vector2(1, 0))
 
-    def _detect_terrain_collision(self, future_pos: Vector2) -> None:
+    def _detect_terrain_collision(
+        self, future_pos: Tuple[float, float]
+    ) -> None:
         """Detect collision with Terrain."""
-        walls = self._blueprint.walls
-        col_index = self.get_rect(future_pos).collidelist(walls)
-        if col_index < 0:
+        wall = self._blueprint.find_wall(self.get_rect(future_pos))
+        if wall is None:
             return
 
-        normal = self._find_normal(pos=self._curr_pos, wall=walls[col_index])
+        pos = Vector2(self._x, self._y)
+        normal = self._find_normal(pos=pos, wall=wall)
         self._handle_reflection(normal=normal)
 
     def _find_normal(self, pos: Vector2, wall: Rect) -> Vector2:
@@ -89,32 +110,32 @@ class Projectile:
 
     def _handle_movement(self):
         """Handle the Movement calculations."""
-        drag = self.DRAG_CONSTANT * self.velocity
-        self.velocity += self.GRAVITY + drag
-        if self.velocity.length() <= 0.05:
+        self.velocity *= self.DRAG_FACTOR
+        self.velocity += self.GRAVITY
+        if self.velocity.length_squared() <= self.MIN_SPEED ** 2:
             raise ProjectileExploded
 
-        future_pos = self._curr_pos + self.velocity
-        self._detect_floor_collision(future_pos=future_pos)
-        self._detect_terrain_collision(future_pos=future_pos)
+        velocity = self.velocity
+        future_x, future_y = self._x + velocity.x, self._y + velocity.y
+        self._detect_floor_collision(future_y=future_y)
+        self._detect_terrain_collision(future_pos=(future_x, future_y))
 
-        # Don't reuse `future_pos`, in case the velocity has changed.
-        self._curr_pos += self.velocity
+        # Don't reuse the future position, in case the velocity has changed.
+        self._x += velocity.x
+        self._y += velocity.y
 
     def _handle_reflection(self, normal: Vector2):
         """Reflect the projectile against a normal vector."""
         self.velocity.reflect_ip(normal)
         self.velocity *= self.COR
 
-    @property
-    def radius(self) -> int:
-        """Projectile Radius."""
-        return 3
+    def get_rect(self, pos: Tuple[float, float]) -> Rect:
+        """Collision rectangle centered on `pos`.
 
-    def get_rect(self, pos: Vector2) -> Rect:
-        rect = Rect((0, 0), (self.radius * 2, self.radius * 2))
-        rect.center = pos
-        return rect
+        The same Rect is reused (and moved) on every call.
+        """
+        self._rect.center = pos
+        return self._rect
 
     def process_logic(self) -> None:
         """Process the Projectile logic and update its status."""
@@ -127,8 +148,10 @@ class Projectile:
         A linear interpolation is made between the current position and a
         prediction of the next position.
         """
-        next_pos: Vector2 = self._curr_pos + self.velocity
-        return self._curr_pos.lerp(next_pos, interp)
+        velocity = self.velocity
+        return Vector2(
+            self._x + velocity.x * interp, self._y + velocity.y * interp
+        )
 
 
 class ProjectileManager:
@@ -140,7 +163,7 @@ class ProjectileManager:
         :param blueprint: Terrain Blueprint.
         """
         self._blueprint = blueprint
-        self._projectiles: Set[Projectile] = set()
+        self._projectiles: List[Projectile] = []
 
         self.latest: Optional[Projectile] = None
 
@@ -153,31 +176,58 @@ class ProjectileManager:
         projectile = Projectile(
             blueprint=self._blueprint, velocity=velocity, pos=pos
         )
-        self._projectiles.add(projectile)
+        self._projectiles.append(projectile)
         self.latest = projectile
 
     def process_logic(self) -> None:
-        """Process logic and update status."""
-        to_be_removed = set()
-        for proj in self._projectiles:
+        """Process logic and update status.
+
+        Exploded projectiles are removed by compacting the list in place.
+        """
+        projectiles = self._projectiles
+        alive = 0
+        for proj in projectiles:
             try:
                 proj.process_logic()
             except ProjectileExploded:
-                to_be_removed.add(proj)
-                if self.latest == proj:
+                if self.latest is proj:
                     self.latest = None
+                continue
+
+            projectiles[alive] = proj
+            alive += 1
+
+        del projectiles[alive:]
+
+    @cached_property
+    def _sprite(self) -> Surface:
+        """Pre-rendered Projectile, blitted once per projectile."""
+        radius = Projectile.RADIUS
+        sprite = Surface(size=(radius * 2 + 1,) * 2, flags=pygame.SRCALPHA)
+        draw.circle(
+            surface=sprite,
+            color=Projectile.COLOR,
+            center=(radius, radius),
+            radius=radius,
+        )
+        return sprite
 
-        self._projectiles -= to_be_removed
+    @cached_property
+    def _surface(self) -> Surface:
+        """Surface the projectiles are rendered to. Reused between frames."""
+        return Surface(size=self._blueprint.rect.size, flags=pygame.SRCALPHA)
 
     def build_surface(self, interp: float) -> Surface:
         """Fully rendered Surface."""
-        sface = Surface(size=self._blueprint.rect.size, flags=pygame.SRCALPHA)
-        for proj in self._projectiles:
-            draw.circle(
-                surface=sface,
-                color=proj.COLOR,
-                center=proj.get_render_position(interp=interp),
-                radius=proj.radius,
-            )
-
+        sface = self._surface
+        sface.fill(color=(0, 0, 0, 0))
+
+        sprite, offset = self._sprite, Vector2(Projectile.RADIUS)
+        sface.blits(
+            (
+                (sprite, proj.get_render_position(interp=interp) - offset)
+                for proj in self._projectiles
+            ),
+            doreturn=0,
+        )
         return sface
@@ -4,6 +4,9 @@ BG_COLOR = (0x00, 0x00, 0x00)
 FPS_SIZE = 25
 FPS_COLOR = (0xFF, 0x00, 0x00)
 
+#: Minimum time between re-renders of the debug/FPS text (ms).
+DEBUG_REFRESH = 250.0
+
 #: Grid Parameters
 GRID_COLOR = (0xFF, 0xFF, 0xFF)
 GRID_WIDTH = 1
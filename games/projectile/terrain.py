@@ -2,7 +2,7 @@ import json
 from enum import Enum
 from functools import cached_property
 from pathlib import Path
-from typing import Dict, List, Tuple, Union
+from typing import Dict, List, Optional, Tuple, Union
 
 import pygame
 from pygame.math import Vector2
@@ -40,7 +40,11 @@ class Block:
 
 
 class Blueprint:
-    """Terrain Blueprint."""
+    """Terrain Blueprint.
+
+    Blueprints don't change once loaded, so the geometry derived from them is
+    cached. It's read by every projectile, on every tick.
+    """
 
     def __init__(self, name: str):
         """Represent the Terrain as a blueprint."""
@@ -54,7 +58,7 @@ class Blueprint:
         with filepath.open() as fd:
             return json.load(fd)
 
-    @property
+    @cached_property
     def block_size(self) -> Vector2:
         """Size of a single block unit."""
         return Vector2(
@@ -62,7 +66,7 @@ class Blueprint:
             y=self._data["block"]["height"],
         )
 
-    @property
+    @cached_property
     def height(self) -> int:
         """Terrain Height."""
         return len(self.terrain)
@@ -72,7 +76,7 @@ class Blueprint:
         """Blueprint Name."""
         return self._data["name"]
 
-    @property
+    @cached_property
     def rect(self) -> Rect:
         """Rectangle with total size of the Blueprint."""
         return Rect(
@@ -106,7 +110,37 @@ class Blueprint:
             blk.rect for blk in self.blocks if blk.type == BlockType.WALL
         )
 
-    @property
+    @cached_property
+    def wall_cells(self) -> Dict[Tuple[int, int], Rect]:
+        """Walls indexed by their (x, y) cell in the blueprint grid."""
+        return {
+            (blk.x, blk.y): blk.rect
+            for blk in self.blocks
+            if blk.type == BlockType.WALL
+        }
+
+    def find_wall(self, rect: Rect) -> Optional[Rect]:
+        """Find a wall colliding with the rectangle.
+
+        Only the cells overlapped by the rectangle are checked, instead of
+        every wall in the blueprint.
+
+        :param rect: Rectangle, in screen coordinates.
+        :return: First colliding wall (row-major order), if any.
+        """
+        cells = self.wall_cells
+        block_w, block_h = self.block_size
+        x0, x1 = int(rect.left // block_w), int((rect.right - 1) // block_w)
+        y0, y1 = int(rect.top // block_h), int((rect.bottom - 1) // block_h)
+        for y in range(y0, y1 + 1):
+            for x in range(x0, x1 + 1):
+                wall = cells.get((x, y))
+                if wall and rect.colliderect(wall):
+                    return wall
+
+        return None
+
+    @cached_property
     def width(self) -> int:
         """Terrain Width."""
         return len(self.terrain[0])
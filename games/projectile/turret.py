@@ -1,9 +1,11 @@
 """Define the Turret entity."""
 from enum import Enum
+from typing import Optional
 
 import pygame
 from pygame import draw
 from pygame.color import Color
+from pygame.locals import K_DOWN, K_LEFT, K_RIGHT, K_SPACE, K_UP
 from pygame.math import Vector2
 from pygame.surface import Surface
 
@@ -61,11 +63,13 @@ class Turret:
         #: Location in the Grid.
         self._loc: Vector2 = self._find_in_blueprint()
 
+        #: Rendered Turret. Redrawn only when the aim changes.
+        self._surface: Optional[Surface] = None
+
         #: Aim Direction
-        self.aim = Vector2()
-        self.aim.from_polar(
-            (self._bs.length() * self.AIM_RATE, self.INITIAL_ANGLE)
-        )
+        aim = Vector2()
+        aim.from_polar((self._bs.length() * self.AIM_RATE, self.INITIAL_ANGLE))
+        self.aim = aim
 
         #: Initial Projectile Speed (m/s).
         self.speed = 155.0 * SPEED_CONSTANT
@@ -73,12 +77,11 @@ class Turret:
     def _find_in_blueprint(self) -> Vector2:
         """Determine the initial position using the Blueprint."""
         for i, row in enumerate(self._bp.terrain):
-            try:
-                return Vector2(x=row.index(self.CHAR), y=i)
-            except ValueError:
-                continue
+            j = row.find(self.CHAR)
+            if j != -1:
+                return Vector2(x=j, y=i)
 
-        raise RuntimeError("Turret missing from blueprint.")
+        raise LookupError("Turret missing from blueprint.")
 
     def _fire_gun(self, tick: float) -> None:
         """Fire a Projectile from the Turret.
@@ -93,6 +96,34 @@ class Turret:
         self._pm.create_projectile(velocity=velocity, pos=proj_pos)
         self._last_shot = time_ms()
 
+    def _draw_surface(self) -> Surface:
+        """Draw the Turret on a new Surface."""
+        surface = Surface(size=self._bs, flags=pygame.SRCALPHA)
+        draw.circle(  # Base
+            surface=surface,
+            color=self.COLOR,
+            center=self.center,
+            radius=self.radius,
+        )
+        draw.line(  # Aim
+            surface=surface,
+            color=self.COLOR,
+            start_pos=self.center,
+            end_pos=self.center + self.aim,
+            width=self.aim_width,
+        )
+        return surface
+
+    @property
+    def aim(self) -> Vector2:
+        """Aim Direction."""
+        return self._aim
+
+    @aim.setter
+    def aim(self, aim: Vector2) -> None:
+        self._aim = aim
+        self._surface = None  # Invalidate the rendered Turret.
+
     @property
     def aim_width(self) -> int:
         return int(self._bs.length() * self.AIM_WIDTH_RATE)
@@ -121,25 +152,14 @@ class Turret:
     def surface(self) -> Surface:
         """Turret Surface.
 
-        It's drawn every time it's referenced.
+        It's only redrawn after the aim changes.
 
         :return: Turret Surface.
         """
-        surface = Surface(size=self._bs, flags=pygame.SRCALPHA)
-        draw.circle(  # Base
-            surface=surface,
-            color=self.COLOR,
-            center=self.center,
-            radius=self.radius,
-        )
-        draw.line(  # Aim
-            surface=surface,
-            color=self.COLOR,
-            start_pos=self.center,
-            end_pos=self.center + self.aim,
-            width=self.aim_width,
-        )
-        return surface
+        if self._surface is None:
+            self._surface = self._draw_surface()
+
+        return self._surface
 
     def process_logic(self, tick: float) -> None:
         """Process Turret logic.
@@ -148,15 +168,15 @@ class Turret:
         """
         pressed = pygame.key.get_pressed()
 
-        if pressed[pygame.K_UP]:
+        if pressed[K_UP]:
             self.speed += SPEED_CONSTANT
-        elif pressed[pygame.K_DOWN]:
+        elif pressed[K_DOWN]:
             self.speed -= SPEED_CONSTANT
 
-        if pressed[pygame.K_RIGHT]:
+        if pressed[K_RIGHT]:
             self.aim = self.aim.rotate(self.AIM_SENSITIVITY)
-        elif pressed[pygame.K_LEFT]:
+        elif pressed[K_LEFT]:
             self.aim = self.aim.rotate(-self.AIM_SENSITIVITY)
 
-        if pressed[pygame.K_SPACE]:
+        if pressed[K_SPACE]:
             self._fire_gun(tick=tick)
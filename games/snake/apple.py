@@ -8,6 +8,8 @@ from games.snake.elements import GridElement, RandomPoint
 class Apple(GridElement):
     """Apple."""
 
+    __slots__ = ()
+
     #: Apple Color
     COLOR = Color(0xFF, 0x00, 0x00)
 
@@ -1,8 +1,5 @@
 """Define base game elements that interact with the grid."""
-from dataclasses import dataclass
-from functools import cached_property
-from random import randint
-from typing import Optional
+from typing import Mapping, Optional, Tuple
 
 from pygame.color import Color
 from pygame.rect import Rect
@@ -15,29 +12,53 @@ from games.utils import PINK, Layer, Position
 Grid = "snake.grid.Grid"
 
 
-@dataclass
+#: Grid displacement (dx, dy) for each movement State.
+DELTA: Mapping[State, Tuple[int, int]] = {
+    State.UP: (0, -1),
+    State.DOWN: (0, 1),
+    State.RIGHT: (1, 0),
+    State.LEFT: (-1, 0),
+}
+
+
 class Point:
     """A Point in the Grid."""
 
-    x: int
-    y: int
+    __slots__ = ("x", "y")
+
+    def __init__(self, x: int, y: int):
+        self.x = x
+        self.y = y
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, Point):
+            return NotImplemented
+
+        return self.x == other.x and self.y == other.y
+
+    def __repr__(self) -> str:
+        return f"Point(x={self.x}, y={self.y})"
 
     def __str__(self) -> str:
         return f"({self.x}, {self.y})"
 
+    def cell_id(self, width: int) -> int:
+        """Pack the point into a single integer, unique within the grid.
+
+        :param width: Number of cells in each grid row.
+        """
+        return self.y * width + self.x
+
+    def advance(self, state: State) -> None:
+        """Move the point in place, based on the State."""
+        dx, dy = DELTA.get(state, (0, 0))
+        self.x += dx
+        self.y += dy
+
     def clone(self, state: State) -> "Point":
         """Return a new point in a location based on the State."""
-        new_x, new_y = self.x, self.y
-        if state == State.UP:
-            new_y -= 1
-        elif state == State.DOWN:
-            new_y += 1
-        elif state == State.RIGHT:
-            new_x += 1
-        elif state == State.LEFT:
-            new_x -= 1
-
-        return Point(x=new_x, y=new_y)
+        dx, dy = DELTA.get(state, (0, 0))
+        return Point(x=self.x + dx, y=self.y + dy)
 
     def collision(self: "Point", other: "Point") -> bool:
         """Detect collision between two points."""
@@ -47,15 +68,20 @@ class Point:
 class RandomPoint(Point):
     """A random point in the grid."""
 
+    __slots__ = ()
+
     def __init__(self, grid: Grid):
-        x = randint(0, GRID_SIZE[0] - 1)
-        y = randint(0, GRID_SIZE[1] - 1)
+        rng = grid.rng
+        x = rng.randrange(GRID_SIZE[0])
+        y = rng.randrange(GRID_SIZE[1])
         super().__init__(x=x, y=y)
 
 
 class GridElement:
     """An element that fits into a Grid unit."""
 
+    __slots__ = ("_grid", "_p", "_layer", "_rect", "_render_pos", "surface")
+
     # Use pink to highlight default case.
     COLOR: Color = PINK
 
@@ -70,34 +96,82 @@ class GridElement:
         :param point: Element coordinates in the grid.
         """
         self._grid = grid
+
+        #: Element Surface. Needs to fit into a grid cell.
+        self.surface = Surface(size=(GRID_STEP, GRID_STEP))
+        self.surface.fill(color=self.COLOR)
+
+        #: Position dependent caches. Reset every time the element moves.
+        self._layer: Optional[Layer] = None
+        self._rect: Optional[Rect] = None
+        self._render_pos: Optional[Position] = None
+
         self.p: Point = point or RandomPoint(grid=grid)
 
+    def _mark_moved(self) -> None:
+        """Invalidate all caches that depend on the element position."""
+        self._layer = None
+        self._rect = None
+        self._render_pos = None
+
+    @property
+    def p(self) -> Point:
+        """Element coordinates in the grid."""
+        return self._p
+
+    @p.setter
+    def p(self, point: Point) -> None:
+        self._p = point
+        self._mark_moved()
+
     @property
     def layer(self) -> Layer:
-        """Rendering Layer."""
-        return Layer(self.surface, self.render_pos)
+        """Rendering Layer.
+
+        Cached until the element is moved to another point.
+        """
+        if self._layer is None:
+            self._layer = Layer(self.surface, self.render_pos)
+
+        return self._layer
 
-    @cached_property
-    def surface(self) -> Surface:
-        """Element Surface.
+    def move(self, origin: Point, state: State) -> None:
+        """Move the element next to `origin`, based on the State.
 
-        Needs to fit into a grid cell.
+        The current Point is updated in place instead of being replaced.
+
+        :param origin: Point the movement starts from.
+        :param state: Direction of the movement.
         """
-        surface = Surface(size=(GRID_STEP, GRID_STEP))
-        surface.fill(color=self.COLOR)
-        return surface
+        self._p.x, self._p.y = origin.x, origin.y
+        self._p.advance(state=state)
+        self._mark_moved()
 
     @property
     def rect(self) -> Rect:
-        """Rectangle representing the element."""
-        return Rect(
-            self.p.x * GRID_STEP,
-            self.p.y * GRID_STEP,
-            GRID_STEP,
-            GRID_STEP,
-        )
+        """Rectangle representing the element.
+
+        Cached until the element is moved to another point.
+        """
+        if self._rect is None:
+            self._rect = Rect(
+                self.p.x * GRID_STEP,
+                self.p.y * GRID_STEP,
+                GRID_STEP,
+                GRID_STEP,
+            )
+
+        return self._rect
 
     @property
     def render_pos(self) -> Position:
-        """Render position in screen coordinates."""
-        return Position(self.p.x * GRID_STEP, self.p.y * GRID_STEP + UI_HEIGHT)
+        """Render position in screen coordinates.
+
+        Cached until the element is moved to another point.
+        """
+        if self._render_pos is None:
+            self._render_pos = Position(
+                self.p.x * GRID_STEP, self.p.y * GRID_STEP + UI_HEIGHT
+            )
+
+        return self._render_pos
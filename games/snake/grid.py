@@ -1,6 +1,7 @@
 """Define the grid and its generic elements."""
 from functools import cached_property
 from itertools import chain
+from random import Random
 from typing import Iterable
 
 import pygame
@@ -30,6 +31,9 @@ class Grid:
         self.width, self.height = self.resolution
         self.rect = Rect((0, UI_HEIGHT), self.resolution)
 
+        #: Random generator for the elements placed in this grid.
+        self.rng = Random()
+
         self.apple = Apple(grid=self)
         self.snake = Snake(grid=self)
 
@@ -51,14 +55,15 @@ class Grid:
 
         return surface
 
+    @cached_property
+    def base_layer(self) -> Layer:
+        """Layer representing the Grid."""
+        return Layer(self.base_surface, Position(0, UI_HEIGHT))
+
     @property
     def layers(self) -> Iterable[Layer]:
         """Surface layers to be blitted to the screen."""
-        layers = (
-            Layer(self.base_surface, Position(0, UI_HEIGHT)),
-            self.apple.layer,
-        )
-        return chain(layers, self.snake.layers)
+        return chain((self.base_layer, self.apple.layer), self.snake.layers)
 
     def handle_event(self, event: Event) -> None:
         """Handle Game Events.
@@ -1,7 +1,6 @@
 """Main Application."""
 from functools import cached_property
-from itertools import chain
-from typing import Iterable
+from typing import Iterable, List
 
 import pygame
 from pygame.event import Event
@@ -28,6 +27,9 @@ class MainApp(GameApplication):
     CAPTION = CAPTION
     TICK_STEP = TICK_STEP
 
+    #: The snake only moves on ticks, so there's nothing new to draw between.
+    DRAW_ON_DIRTY = True
+
     def __init__(self, debug: bool):
         """Main Application.
 
@@ -44,6 +46,9 @@ class MainApp(GameApplication):
         self._grid = Grid()
         self._ui = UserInterface(grid=self._grid)
 
+        #: Layers to be blitted on each frame. Reused between frames.
+        self._layers: List[Layer] = []
+
     @property
     def _debug_layers(self) -> Iterable[Layer]:
         """Debug text layers."""
@@ -70,14 +75,16 @@ class MainApp(GameApplication):
 
     def _handle_updates(self, tick: float) -> None:
         self._grid.update_state()
+        self._dirty = True
 
     def _draw_graphics(self, interp: float) -> None:
-        """Render the frame and display it in the screen."""
-        layer_groups = [self._grid.layers, self._ui.layers]
+        """Draw contents of the frame to the Screen."""
+        layers = self._layers
+        layers.clear()
+        layers.extend(self._grid.layers)
+        layers.extend(self._ui.layers)
         if self._debug:
-            layer_groups.append(self._debug_layers)
+            layers.extend(self._debug_layers)
 
         self._screen.fill(color=BG_COLOR)
-        self._screen.blits(chain(*layer_groups))
-        pygame.display.flip()
-        self._render_clock.tick()
+        self._screen.blits(layers, doreturn=0)
@@ -1,13 +1,15 @@
 """Represent the Main Protagonist."""
 from collections import deque
-from typing import Iterable, Mapping
+from typing import Iterable, Mapping, Optional, Set
 
 import pygame
 from pygame.color import Color
 from pygame.event import Event
+from pygame.locals import KEYDOWN
 
 from games.snake.elements import GridElement
 from games.snake.enums import State
+from games.snake.settings import GRID_SIZE
 from games.utils import Layer
 
 Grid = "snake.grid.Grid"
@@ -20,6 +22,8 @@ class KillSnake(Exception):
 class Segment(GridElement):
     """Snake Body Segment."""
 
+    __slots__ = ()
+
     COLOR = Color(0x00, 0xBB, 0x00)
 
 
@@ -66,6 +70,13 @@ class Snake:
         #: kept in place, preserving its shape.
         self.body: deque[Segment] = deque([Segment(grid=grid)])
 
+        #: Cells occupied by the body, packed with `Point.cell_id`. Doesn't
+        #: include the new head until its collisions are processed.
+        self._cells: Set[int] = {self._cell_id(self.body[0])}
+
+        #: Tail segment removed on the last step, recycled as the next head.
+        self._spare: Optional[Segment] = None
+
     def __len__(self) -> int:
         """Number of segments."""
         return len(self.body)
@@ -79,58 +90,67 @@ class Snake:
     def layers(self) -> Iterable[Layer]:
         return (b.layer for b in self.body)
 
+    @staticmethod
+    def _cell_id(segment: Segment) -> int:
+        """Grid cell occupied by a segment, packed as an integer."""
+        return segment.p.cell_id(width=GRID_SIZE[0])
+
     def _body_collision(self) -> bool:
         """Detect collision between the head and the rest of the body."""
-        head = self.body[0].p
-        body_segments = iter(self.body)
-        next(body_segments)  # Skip the Head
-        for segment in body_segments:
-            if head.collision(segment.p):
-                return True
-
-        return False
+        return self._cell_id(self.body[0]) in self._cells
 
     def handle_event(self, event: Event) -> None:
         """Handle Game Events.
 
         :param event: Pygame Event to be handled.
         """
-        if event.type != pygame.KEYDOWN:
+        if event.type != KEYDOWN:
             return
 
-        forbidden = self.FORBIDDEN_MOVEMENT.get(self._state)
-        if event.key == forbidden:
+        next_state = self.STATE_MAP.get(event.key)
+        if next_state is None:
+            return  # Not a movement key.
+
+        if event.key == self.FORBIDDEN_MOVEMENT.get(self._state):
             return
 
-        next_state = self.STATE_MAP.get(event.key)
-        if next_state:
-            self._next_state = next_state
+        self._next_state = next_state
 
     def _process_movement(self) -> None:
         """Process the Snake movement.
 
-        Create new head, based on the current state.
+        Create new head, based on the current state. The tail removed on the
+        previous step is reused, if available, to avoid new allocations.
         """
-        new_point = self.body[0].p.clone(state=self._state)
-        new_head = Segment(grid=self._grid, point=new_point)
+        head = self.body[0].p
+        if self._spare:
+            new_head, self._spare = self._spare, None
+            new_head.move(origin=head, state=self._state)
+        else:
+            new_point = head.clone(state=self._state)
+            new_head = Segment(grid=self._grid, point=new_point)
+
         self.body.appendleft(new_head)
 
     def _process_collision(self) -> None:
         """Detect Collision between Snake and other game elements."""
         head = self.body[0]
-        if self._body_collision():
-            self._next_state = State.DEAD
+        # Check the bounds first. Cell IDs are only unique inside the grid.
+        if not head.rect.colliderect(self._grid.rect):
             raise KillSnake
 
-        if not head.rect.colliderect(self._grid.rect):
+        if self._body_collision():
+            self._next_state = State.DEAD
             raise KillSnake
 
+        self._cells.add(self._cell_id(head))
         if head.p.collision(self._apple.p):
             self._apple.respawn()
             return  # Skip the pop, so it'll grow.
 
         # Remove tail after each movement to preserve its length.
-        self.body.pop()
+        self._spare = self.body.pop()
+        self._cells.discard(self._cell_id(self._spare))
 
     def update_state(self) -> None:
         """Update the Snake state."""
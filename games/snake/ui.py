@@ -1,4 +1,5 @@
 """User Interface."""
+from functools import cached_property
 from typing import Iterable
 
 from pygame.surface import Surface
@@ -18,7 +19,7 @@ class UserInterface:
         """
         self._grid = grid
 
-    @property
+    @cached_property
     def layers(self) -> Iterable[Layer]:
         """Rendering Layers."""
         surface = Surface(size=(SCREEN_WIDTH, UI_HEIGHT))